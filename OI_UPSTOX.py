@@ -7,6 +7,7 @@ import plotly.graph_objects as go
 import gzip
 import json
 from datetime import datetime
+from oi_analytics import get_profile
 
 # -------------------- CONFIG --------------------
 st.set_page_config(page_title="Upstox Option Chain Analysis", layout="wide")
@@ -238,6 +239,39 @@ fig_oi.add_trace(go.Bar(x=df["Strike_int"], y=df["PE_OI"], name="PE OI", marker_
 fig_oi.update_layout(xaxis_title="Strike", yaxis_title="Open Interest", bargap=0.2)
 st.plotly_chart(fig_oi, use_container_width=True)
 
+# ======= Max Pain / OI walls / cumulative OI profile =======
+# profile is kept per (symbol, expiry) across reruns; only changed strikes are re-applied
+oi_prof = get_profile(st.session_state.setdefault("oi_profiles", {}), (symbol, expiry), df)
+oi_summary = oi_prof.summary()
+
+def fmt_strike(v):
+    return "-" if v is None else f"{int(round(v))}"
+
+st.subheader("🎯 Max Pain & OI Walls")
+m1, m2, m3 = st.columns(3)
+m1.metric("Max Pain", fmt_strike(oi_summary["Max_Pain"]))
+m2.metric("Support (PE wall)", fmt_strike(oi_summary["Support"]))
+m3.metric("Resistance (CE wall)", fmt_strike(oi_summary["Resistance"]))
+
+prof_df = pd.DataFrame(oi_prof.profile_rows())
+prof_df["Strike_int"] = prof_df["Strike"].round(0).astype(int)
+fig_cum = go.Figure()
+fig_cum.add_trace(go.Scatter(x=prof_df["Strike_int"], y=prof_df["CE_cum_OI"], mode="lines", name="CE cumulative OI", line_color="green"))
+fig_cum.add_trace(go.Scatter(x=prof_df["Strike_int"], y=prof_df["PE_cum_OI"], mode="lines", name="PE cumulative OI", line_color="red"))
+if oi_summary["Max_Pain"] is not None:
+    fig_cum.add_vline(x=int(round(oi_summary["Max_Pain"])), line_dash="dash", line_color="purple",
+                      annotation_text=f"Max Pain {fmt_strike(oi_summary['Max_Pain'])}", annotation_position="top left")
+fig_cum.update_layout(xaxis_title="Strike", yaxis_title="Cumulative OI")
+st.plotly_chart(fig_cum, use_container_width=True)
+
+w1, w2 = st.columns(2)
+with w1:
+    st.write("### CE OI walls")
+    st.table(pd.DataFrame([{"Strike": int(round(k)), "CE_OI": int(v)} for k, v in oi_prof.walls("CE")]))
+with w2:
+    st.write("### PE OI walls")
+    st.table(pd.DataFrame([{"Strike": int(round(k)), "PE_OI": int(v)} for k, v in oi_prof.walls("PE")]))
+
 # ======= CHART: Premium Movement (no IV spike markers per request) =======
 st.subheader("💰 Premium Movement (CE / PE)")
 fig_prem = go.Figure()
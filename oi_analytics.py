@@ -0,0 +1,177 @@
+# oi_analytics.py — Max pain, OI walls & support/resistance (shared by app + scanner)
+
+# Max pain for settlement at strike K_j is the total intrinsic value paid to
+# option holders:
+#     pain(K_j) = sum_i CE_OI_i * max(0, K_j - K_i) + sum_i PE_OI_i * max(0, K_i - K_j)
+# With strikes sorted, both sums split into prefix / suffix sums of OI and
+# OI*strike, so the whole pain curve is built in O(strikes) instead of O(strikes²).
+
+# -------------------- TUNABLES / DEFAULTS --------------------
+WALL_COUNT = 3               # top strikes by OI reported as walls
+MAX_INCREMENTAL_CHANGES = 4  # beyond this many changed strikes, a full rebuild is cheaper
+
+
+# -------------------- PROFILE --------------------
+class OIProfile:
+    """Pain curve, cumulative OI and walls for one option chain (one symbol + expiry)."""
+
+    def __init__(self, strikes, ce_oi, pe_oi, spot=0.0):
+        self.spot = float(spot)
+        self._load(strikes, ce_oi, pe_oi)
+
+    @classmethod
+    def from_chain(cls, df):
+        """Build from a chain frame with Strike / CE_OI / PE_OI (and optionally Spot) columns."""
+        spot = float(df["Spot"].iloc[0]) if "Spot" in df.columns and len(df) else 0.0
+        return cls(df["Strike"].tolist(), df["CE_OI"].tolist(), df["PE_OI"].tolist(), spot)
+
+    # ---------- build ----------
+    def _load(self, strikes, ce_oi, pe_oi):
+        rows = sorted(zip(strikes, ce_oi, pe_oi), key=lambda r: float(r[0]))
+        self.strikes = [float(r[0]) for r in rows]
+        self.ce_oi = [float(r[1]) for r in rows]
+        self.pe_oi = [float(r[2]) for r in rows]
+        self._index = {k: i for i, k in enumerate(self.strikes)}
+        self._rebuild()
+
+    def _rebuild(self):
+        n = len(self.strikes)
+        ks, ce, pe = self.strikes, self.ce_oi, self.pe_oi
+
+        # call side: sum over strikes below K_j -> running prefix sums
+        pain = [0.0] * n
+        oi_sum = oik_sum = 0.0
+        for j in range(n):
+            pain[j] = ks[j] * oi_sum - oik_sum
+            oi_sum += ce[j]
+            oik_sum += ce[j] * ks[j]
+
+        # put side: sum over strikes above K_j -> running suffix sums
+        oi_sum = oik_sum = 0.0
+        for j in range(n - 1, -1, -1):
+            pain[j] += oik_sum - ks[j] * oi_sum
+            oi_sum += pe[j]
+            oik_sum += pe[j] * ks[j]
+
+        self.pain = pain
+
+    # ---------- incremental update ----------
+    def update(self, changes, spot=None):
+        """Apply {strike: (ce_oi, pe_oi)} to the profile.
+
+        A CE OI change at K_i only moves pain at strikes above K_i (and a PE change
+        only below), so a handful of changed strikes are patched in place. Unknown
+        strikes or many changes fall back to a full rebuild.
+        """
+        if spot is not None:
+            self.spot = float(spot)
+        if not changes:
+            return self
+
+        if len(changes) > MAX_INCREMENTAL_CHANGES or any(float(k) not in self._index for k in changes):
+            for k, (c, p) in changes.items():
+                i = self._index.get(float(k))
+                if i is None:
+                    self.strikes.append(float(k))
+                    self.ce_oi.append(float(c))
+                    self.pe_oi.append(float(p))
+                else:
+                    self.ce_oi[i], self.pe_oi[i] = float(c), float(p)
+            self._load(self.strikes, self.ce_oi, self.pe_oi)
+            return self
+
+        ks, pain = self.strikes, self.pain
+        for k, (c, p) in changes.items():
+            i = self._index[float(k)]
+            d_ce = float(c) - self.ce_oi[i]
+            d_pe = float(p) - self.pe_oi[i]
+            self.ce_oi[i], self.pe_oi[i] = float(c), float(p)
+            ki = ks[i]
+            if d_ce:
+                for j in range(i + 1, len(ks)):
+                    pain[j] += d_ce * (ks[j] - ki)
+            if d_pe:
+                for j in range(i):
+                    pain[j] += d_pe * (ki - ks[j])
+        return self
+
+    def diff(self, df):
+        """Strikes whose CE/PE OI in `df` differs from this profile, as {strike: (ce_oi, pe_oi)}."""
+        out = {}
+        for k, c, p in zip(df["Strike"].tolist(), df["CE_OI"].tolist(), df["PE_OI"].tolist()):
+            k, c, p = float(k), float(c), float(p)
+            i = self._index.get(k)
+            if i is None or self.ce_oi[i] != c or self.pe_oi[i] != p:
+                out[k] = (c, p)
+        return out
+
+    # ---------- results ----------
+    @property
+    def max_pain(self):
+        if not self.strikes:
+            return None
+        return self.strikes[min(range(len(self.pain)), key=self.pain.__getitem__)]
+
+    def walls(self, side, n=WALL_COUNT):
+        """Top-n strikes by OI for side 'CE' or 'PE', highest first."""
+        oi = self.ce_oi if side == "CE" else self.pe_oi
+        order = sorted(range(len(oi)), key=lambda i: oi[i], reverse=True)[:n]
+        return [(self.strikes[i], oi[i]) for i in order if oi[i] > 0]
+
+    @property
+    def resistance(self):
+        """Highest-CE-OI strike at or above spot (call wall)."""
+        return self._wall_strike(self.ce_oi, lambda k: k >= self.spot)
+
+    @property
+    def support(self):
+        """Highest-PE-OI strike at or below spot (put wall)."""
+        return self._wall_strike(self.pe_oi, lambda k: k <= self.spot)
+
+    def _wall_strike(self, oi, in_zone):
+        idx = [i for i, k in enumerate(self.strikes) if in_zone(k) and oi[i] > 0]
+        if not idx:
+            idx = [i for i in range(len(oi)) if oi[i] > 0]
+        if not idx:
+            return None
+        return self.strikes[max(idx, key=oi.__getitem__)]
+
+    def profile_rows(self):
+        """Per-strike rows (Strike, cumulative CE/PE OI, pain) for charts/tables."""
+        rows = []
+        ce_cum = pe_cum = 0.0
+        for k, c, p, v in zip(self.strikes, self.ce_oi, self.pe_oi, self.pain):
+            ce_cum += c
+            pe_cum += p
+            rows.append({"Strike": k, "CE_cum_OI": ce_cum, "PE_cum_OI": pe_cum, "Pain": v})
+        return rows
+
+    def summary(self):
+        """Headline numbers for a chain, one dict (fits a scanner row)."""
+        return {
+            "Max_Pain": self.max_pain,
+            "Support": self.support,
+            "Resistance": self.resistance,
+            "CE_Wall_OI": max(self.ce_oi, default=0.0),
+            "PE_Wall_OI": max(self.pe_oi, default=0.0),
+        }
+
+
+# -------------------- HELPERS --------------------
+def max_pain(strikes, ce_oi, pe_oi):
+    return OIProfile(strikes, ce_oi, pe_oi).max_pain
+
+
+def get_profile(cache: dict, key, df):
+    """Return an up-to-date OIProfile for `key` (e.g. (symbol, expiry)).
+
+    Reuses the profile kept in `cache` (such as st.session_state) and patches
+    only the strikes whose OI changed since the last snapshot.
+    """
+    spot = float(df["Spot"].iloc[0]) if "Spot" in df.columns and len(df) else 0.0
+    prof = cache.get(key)
+    if prof is None or {float(k) for k in df["Strike"].tolist()} != set(prof.strikes):
+        prof = OIProfile.from_chain(df)
+        cache[key] = prof
+        return prof
+    return prof.update(prof.diff(df), spot=spot)
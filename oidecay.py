@@ -5,6 +5,7 @@ import requests
 import pandas as pd
 import gzip, json
 from datetime import datetime
+from oi_analytics import get_profile
 
 # ---------------------------- CONFIG ----------------------------
 st.set_page_config(page_title="OTM OI Decay Scanner", layout="wide")
@@ -119,6 +120,7 @@ st.write("Scanning all symbols…")
 # ---------------------------- PROCESS ALL ----------------------------
 
 out_rows = []
+oi_profiles = st.session_state.setdefault("oi_profiles", {})
 
 for sym in symbols:
     inst = sym_to_inst.get(sym)
@@ -155,9 +157,13 @@ for sym in symbols:
                (pe_otm["PE_decay"].iloc[0] <= decay_limit and pe_otm["PE_decay"].iloc[1] <= decay_limit))
 
     if cond_ce or cond_pe:
+        oi_summary = get_profile(oi_profiles, (sym, expiry), df).summary()
         out_rows.append({
             "Symbol": sym,
             "Close": round(spot, 2),
+            "Max_Pain": int(round(oi_summary["Max_Pain"])) if oi_summary["Max_Pain"] is not None else "",
+            "Support": int(round(oi_summary["Support"])) if oi_summary["Support"] is not None else "",
+            "Resistance": int(round(oi_summary["Resistance"])) if oi_summary["Resistance"] is not None else "",
             "CE_OTM1": int(ce_otm["Strike"].iloc[0]) if len(ce_otm) >= 1 else "",
             "CE_Dec1%": round(ce_otm["CE_decay"].iloc[0], 2) if len(ce_otm) >= 1 else "",
             "CE_OTM2": int(ce_otm["Strike"].iloc[1]) if len(ce_otm) >= 2 else "",